@@ -1,27 +1,46 @@
+import atexit
+import functools
+import hashlib
+import itertools
 import logging
+import mmap
 import os
 import re
+import subprocess
 import threading
-import time
 import webbrowser
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from io import BytesIO
-from queue import Queue, Empty
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue
 from tkinter import filedialog, messagebox
-from urllib.request import urlopen
 
 import customtkinter as ctk
 from PIL import Image
+import urllib3
 import yt_dlp
 
+try:
+    import pyvips
+except (ImportError, OSError):
+    pyvips = None
+
 APP_TITLE = "RT57 霊桜 Studio"
 APP_TAGLINE = "Studio-grade video intelligence with sakura energy and clean focus."
 DOWNLOAD_DIR = "my_videos"
+DOWNLOAD_DIR_ABS = os.path.abspath(DOWNLOAD_DIR)
 LOG_DIR = "logs"
 LOG_FILE = "rt57_rei_sakura.log"
+THUMB_DIR = os.path.join(LOG_DIR, "thumbs")
+THUMB_SIZE = (420, 240)
 VIDEO_EXTENSIONS = (".mp4", ".mkv", ".webm", ".flv", ".avi")
+VIDEO_EXTENSION_SET = frozenset(VIDEO_EXTENSIONS)
 DEFAULT_LANG_PRIORITY = ["ja", "ko", "pl", "ru", "zh-Hans", "zh-Hant", "en", "ar"]
 PREFERRED_LANGS = ["ja", "ko", "pl", "ru", "zh-Hans", "zh-Hant"]
+PREFERRED_LANG_SET = frozenset(PREFERRED_LANGS)
+KIND_PRIORITY = {"Manual": 0, "Auto": 1, "Default": 2}
 ACCENT_COLOR = "#ff7ac1"
 ACCENT_SOFT = "#3ee6b6"
 PANEL_BG = "#141820"
@@ -31,6 +50,18 @@ TEXT_MUTED = "#92a0b3"
 CARD_BG = "#11161e"
 LOGO_GLYPH = "🌸🜂"
 FONT_FAMILY = "Roboto"
+TELEMETRY_TEMPLATE = "Speed: %s   ETA: %s   Size: %s"
+TELEMETRY_IDLE = TELEMETRY_TEMPLATE % ("—", "—", "—")
+WORKER_COUNT = 8
+COMMENT_LIMIT = 10
+PROGRESS_FLUSH_MS = 50
+BYTE_UNITS = ("B", "KB", "MB", "GB", "TB")
+BYTE_SCALES = tuple(1 / 1024**index for index in range(len(BYTE_UNITS)))
+HTTP_POOL = urllib3.PoolManager(
+    maxsize=4, cert_reqs="CERT_REQUIRED", timeout=urllib3.Timeout(connect=2, read=5)
+)
+NEWLINE_PATTERN = re.compile(r"\r\n?")
+URL_PATTERN = re.compile(r"https?://[^\s<>\"'`]+")
 
 
 @dataclass
@@ -48,6 +79,70 @@ class VideoInfo:
     tags: list[str] | None = None
 
 
+def _thumb_cache_path(url: str) -> str:
+    return os.path.join(THUMB_DIR, hashlib.sha1(url.encode()).hexdigest() + ".jpg")
+
+
+def _read_text(path: str) -> str:
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return NEWLINE_PATTERN.sub("\n", str(mapped, "utf-8", "replace"))
+
+
+@functools.lru_cache(maxsize=32)
+def _load_thumbnail(url: str, size: tuple[int, int] = THUMB_SIZE) -> Image.Image:
+    cache_path = _thumb_cache_path(url)
+    if os.path.exists(cache_path):
+        with open(cache_path, "rb") as handle:
+            data = handle.read()
+        try:
+            return _decode_thumbnail(data, size)
+        except Exception as exc:
+            logging.info("Discarding unreadable cached thumbnail %s: %s", cache_path, exc)
+            os.remove(cache_path)
+    response = HTTP_POOL.request("GET", url)
+    if response.status >= 400:
+        raise OSError(f"HTTP {response.status} for {url}")
+    data = response.data
+    image = _decode_thumbnail(data, size)
+    os.makedirs(THUMB_DIR, exist_ok=True)
+    tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as handle:
+        handle.write(data)
+    os.replace(tmp_path, cache_path)
+    return image
+
+
+def _decode_thumbnail(data: bytes, size: tuple[int, int]) -> Image.Image:
+    if pyvips is not None:
+        vimg = pyvips.Image.thumbnail_buffer(data, size[0], height=size[1], size="down")
+        if vimg.hasalpha():
+            vimg = vimg.flatten()
+        vimg = vimg.colourspace("srgb").cast("uchar")
+        return Image.frombytes("RGB", (vimg.width, vimg.height), vimg.write_to_memory())
+    with BytesIO(data) as buffer:
+        image = Image.open(buffer)
+        image.draft("RGB", size)
+        image.load()
+    image = image.convert("RGB")
+    image.thumbnail(size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+    return image
+
+
+def requires_url(handler):
+    @functools.wraps(handler)
+    def wrapper(self, *args, **kwargs):
+        url = self.url_var.get().strip()
+        if not url:
+            messagebox.showwarning("Heads up", "Please paste a YouTube link first.")
+            return None
+        return handler(self, url, *args, **kwargs)
+
+    return wrapper
+
+
 class EagleV75App:
     def __init__(self, root: ctk.CTk) -> None:
         self.root = root
@@ -55,27 +150,52 @@ class EagleV75App:
         self.root.geometry("1040x720")
         self.root.minsize(980, 680)
         self.root.configure(bg=CANVAS_BG)
-        self.queue: Queue[str] = Queue()
+        self._progress_lock = threading.Lock()
+        self._pending_progress: tuple[float, tuple[float, float, float] | None] | None = None
+        self._repaint_scheduled = False
         self.current_info: VideoInfo | None = None
+        self._library_mtime = -1
+        self._library_files: list[str] = []
+        self._pool = ThreadPoolExecutor(max_workers=WORKER_COUNT, thread_name_prefix="rt57")
+        self._closing = False
+        self._ydl_profiles = self._build_ydl_profiles()
+        self._ydl_instances: dict[str, yt_dlp.YoutubeDL] = {}
+        self._ydl_locks = {profile: threading.Lock() for profile in self._ydl_profiles}
+        atexit.register(self._close_downloaders)
         self._setup_logging()
         self._ensure_directory()
         self._build_style()
         self._build_ui()
         self._refresh_video_list()
-        self._poll_queue()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self) -> None:
+        self._closing = True
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
 
     def _ensure_directory(self) -> None:
         os.makedirs(DOWNLOAD_DIR, exist_ok=True)
         os.makedirs(LOG_DIR, exist_ok=True)
+        os.makedirs(THUMB_DIR, exist_ok=True)
 
     def _setup_logging(self) -> None:
         os.makedirs(LOG_DIR, exist_ok=True)
         log_path = os.path.join(LOG_DIR, LOG_FILE)
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s | %(levelname)s | %(message)s",
-            handlers=[logging.FileHandler(log_path, encoding="utf-8"), logging.StreamHandler()],
-        )
+        formatter = logging.Formatter("%(asctime)s | %(levelname)s | %(message)s")
+        handlers: list[logging.Handler] = [
+            logging.FileHandler(log_path, encoding="utf-8"),
+            logging.StreamHandler(),
+        ]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        log_queue: Queue[logging.LogRecord] = Queue(-1)
+        self._log_listener = QueueListener(log_queue, *handlers)
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop)
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter("%(message)s"))
+        logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
         logging.info("RT57 霊桜 Studio session started.")
 
     def _build_style(self) -> None:
@@ -198,20 +318,19 @@ class EagleV75App:
         self.progress_bar.set(0)
         self.progress_bar.pack(fill="x", padx=12, pady=(0, 8))
 
-        self.speed_var = ctk.StringVar(value="Speed: —")
-        self.eta_var = ctk.StringVar(value="ETA: —")
-        self.size_var = ctk.StringVar(value="Size: —")
+        self.telemetry_var = ctk.StringVar(value=TELEMETRY_IDLE)
         metrics = ctk.CTkFrame(performance_card, fg_color="transparent")
         metrics.pack(fill="x", padx=12, pady=(0, 12))
-        ctk.CTkLabel(metrics, textvariable=self.speed_var, text_color=TEXT_MUTED).pack(anchor="w")
-        ctk.CTkLabel(metrics, textvariable=self.eta_var, text_color=TEXT_MUTED).pack(anchor="w")
-        ctk.CTkLabel(metrics, textvariable=self.size_var, text_color=TEXT_MUTED).pack(anchor="w")
+        ctk.CTkLabel(metrics, textvariable=self.telemetry_var, text_color=TEXT_MUTED).pack(anchor="w")
 
         library_card = self._create_card(dashboard_tab, "Local Library")
         self.video_list_frame = ctk.CTkScrollableFrame(
             library_card, fg_color=PANEL_BG, scrollbar_button_color=ACCENT_COLOR, height=180
         )
         self.video_list_frame.pack(fill="both", padx=12, pady=(0, 12))
+        self._video_buttons: dict[str, ctk.CTkButton] = {}
+        self._spare_video_buttons: list[ctk.CTkButton] = []
+        self._video_empty_label = self._empty_label(self.video_list_frame, "No videos downloaded yet.")
 
         subtitles_tab.columnconfigure(0, weight=1)
         subtitles_card = self._create_card(subtitles_tab, "Subtitle Studio")
@@ -281,6 +400,9 @@ class EagleV75App:
             wrap="word",
         )
         self.subtitle_text.pack(fill="both", padx=12, pady=(0, 12))
+        self.subtitle_text.bind("<<Modified>>", self._on_subtitles_modified)
+        self._subtitle_cache = ""
+        self._subtitles_dirty = False
 
         intel_tab.columnconfigure(0, weight=1)
         intel_card = self._create_card(intel_tab, "Comments & Links")
@@ -307,6 +429,8 @@ class EagleV75App:
             intel_card, fg_color=PANEL_BG, scrollbar_button_color=ACCENT_COLOR, height=140
         )
         self.links_list_frame.pack(fill="both", padx=12, pady=(0, 12))
+        self._link_buttons: list[ctk.CTkButton] = []
+        self._links_empty_label = self._empty_label(self.links_list_frame, "No links detected.")
 
         status_frame = ctk.CTkFrame(self.root, fg_color=CANVAS_BG)
         status_frame.grid(row=2, column=0, sticky="ew", padx=24, pady=(0, 18))
@@ -351,71 +475,92 @@ class EagleV75App:
         self.subtitle_title_var.set(f"Title: {title}")
         self.subtitle_desc_var.set(f"Description: {trimmed}")
 
-    def _update_subtitle_stats(self) -> None:
-        content = self.subtitle_text.get("1.0", "end").strip()
-        if not content:
-            self.subtitle_lines_var.set("Subtitle lines: —")
-            return
-        lines = [line for line in content.splitlines() if line.strip()]
-        self.subtitle_lines_var.set(f"Subtitle lines: {len(lines)}")
+    def _update_subtitle_stats(self, content: str) -> None:
+        lines = sum(1 for line in content.splitlines() if line.strip())
+        self.subtitle_lines_var.set(f"Subtitle lines: {lines}" if lines else "Subtitle lines: —")
 
     def _clear_comments(self) -> None:
         self.comments_text.delete("1.0", "end")
-        for child in self.links_list_frame.winfo_children():
-            child.destroy()
-        self._set_status("Cleared comments and links.")
+        self._links_empty_label.pack_forget()
+        self._sync_button_pool(self._link_buttons, self.links_list_frame, [], self._open_url, ACCENT_COLOR)
+        self._set_status_main("Cleared comments and links.")
+
+    def _empty_label(self, parent: ctk.CTkBaseClass, text: str) -> ctk.CTkLabel:
+        return ctk.CTkLabel(parent, text=text, text_color=TEXT_MUTED, font=(FONT_FAMILY, 11))
+
+    def _sync_button_pool(
+        self,
+        pool: list[ctk.CTkButton],
+        parent: ctk.CTkBaseClass,
+        items: list[str],
+        command,
+        text_color: str,
+    ) -> None:
+        for index, item in enumerate(items):
+            if index < len(pool):
+                button = pool[index]
+            else:
+                button = self._list_button(parent, text_color)
+                pool.append(button)
+            if button.cget("text") != item:
+                button.configure(text=item, command=functools.partial(command, item))
+            if not button.winfo_manager():
+                button.pack(fill="x", padx=6, pady=4)
+        for button in pool[len(items):]:
+            button.pack_forget()
+
+    def _list_button(self, parent: ctk.CTkBaseClass, text_color: str) -> ctk.CTkButton:
+        return ctk.CTkButton(
+            parent,
+            fg_color="transparent",
+            hover_color=ACCENT_SOFT,
+            text_color=text_color,
+            anchor="w",
+            corner_radius=12,
+        )
 
     def _render_video_list(self, files: list[str]) -> None:
-        for child in self.video_list_frame.winfo_children():
-            child.destroy()
-        if not files:
-            ctk.CTkLabel(
-                self.video_list_frame,
-                text="No videos downloaded yet.",
-                text_color=TEXT_MUTED,
-                font=(FONT_FAMILY, 11),
-            ).pack(anchor="w", padx=8, pady=6)
-            return
-        for filename in files:
-            ctk.CTkButton(
-                self.video_list_frame,
-                text=filename,
-                command=lambda name=filename: self._select_video(name),
-                fg_color="transparent",
-                hover_color=ACCENT_SOFT,
-                text_color=TEXT_DARK,
-                anchor="w",
-                corner_radius=12,
-            ).pack(fill="x", padx=6, pady=4)
+        if files:
+            self._video_empty_label.pack_forget()
+        elif not self._video_empty_label.winfo_manager():
+            self._video_empty_label.pack(anchor="w", padx=8, pady=6)
+        wanted = set(files)
+        for name in [name for name in self._video_buttons if name not in wanted]:
+            button = self._video_buttons.pop(name)
+            button.pack_forget()
+            self._spare_video_buttons.append(button)
+        following: ctk.CTkButton | None = None
+        for name in reversed(files):
+            button = self._video_buttons.get(name)
+            if button is None:
+                if self._spare_video_buttons:
+                    button = self._spare_video_buttons.pop()
+                else:
+                    button = self._list_button(self.video_list_frame, TEXT_DARK)
+                button.configure(text=name, command=functools.partial(self._select_video, name))
+                if following is None:
+                    button.pack(fill="x", padx=6, pady=4)
+                else:
+                    button.pack(fill="x", padx=6, pady=4, before=following)
+                self._video_buttons[name] = button
+            following = button
 
     def _render_links(self, links: list[str]) -> None:
-        for child in self.links_list_frame.winfo_children():
-            child.destroy()
-        if not links:
-            ctk.CTkLabel(
-                self.links_list_frame,
-                text="No links detected.",
-                text_color=TEXT_MUTED,
-                font=(FONT_FAMILY, 11),
-            ).pack(anchor="w", padx=8, pady=6)
-            return
-        for link in links:
-            ctk.CTkButton(
-                self.links_list_frame,
-                text=link,
-                command=lambda url=link: webbrowser.open(url),
-                fg_color="transparent",
-                hover_color=ACCENT_SOFT,
-                text_color=ACCENT_COLOR,
-                anchor="w",
-                corner_radius=12,
-            ).pack(fill="x", padx=6, pady=4)
-
-    def _set_status(self, text: str) -> None:
+        if links:
+            self._links_empty_label.pack_forget()
+        elif not self._links_empty_label.winfo_manager():
+            self._links_empty_label.pack(anchor="w", padx=8, pady=6)
+        self._sync_button_pool(self._link_buttons, self.links_list_frame, links, self._open_url, ACCENT_COLOR)
+
+    def _set_status_main(self, text: str) -> None:
         self.status_var.set(text)
-        self.queue.put(text)
         logging.info(text)
 
+    def _set_status_worker(self, text: str) -> None:
+        if self._closing:
+            return
+        self.root.after(0, self._set_status_main, text)
+
     def _append_info(self, text: str) -> None:
         self.info_text.configure(state="normal")
         self.info_text.delete("1.0", "end")
@@ -425,7 +570,23 @@ class EagleV75App:
     def _append_subtitles(self, text: str) -> None:
         self.subtitle_text.delete("1.0", "end")
         self.subtitle_text.insert("end", text)
-        self._update_subtitle_stats()
+        self.subtitle_text.edit_modified(False)
+        self._subtitle_cache = text.strip()
+        self._subtitles_dirty = False
+        self._update_subtitle_stats(text)
+
+    def _on_subtitles_modified(self, _event=None) -> None:
+        if self.subtitle_text.edit_modified():
+            self._subtitles_dirty = True
+
+    def _subtitle_content(self) -> str:
+        if not self._subtitles_dirty:
+            return self._subtitle_cache
+        start = self.subtitle_text.search(r"\S", "1.0", "end", regexp=True)
+        if not start:
+            return ""
+        end = self.subtitle_text.search(r"\S", "end", "1.0", backwards=True, regexp=True)
+        return self.subtitle_text.get(start, f"{end} + 1c")
 
     def _append_description(self, text: str) -> None:
         self.description_text.delete("1.0", "end")
@@ -435,24 +596,82 @@ class EagleV75App:
         self.comments_text.delete("1.0", "end")
         self.comments_text.insert("end", text)
 
-    def _fetch_info(self) -> None:
-        url = self.url_var.get().strip()
-        if not url:
-            messagebox.showwarning("Heads up", "Please paste a YouTube link first.")
-            return
-        self._set_status("Analyzing the link...")
-        threading.Thread(target=self._fetch_info_worker, args=(url,), daemon=True).start()
-
-    def _fetch_info_worker(self, url: str) -> None:
-        ydl_opts = {
+    def _build_ydl_profiles(self) -> dict[str, dict]:
+        output_template = os.path.join(DOWNLOAD_DIR, "%(title)s.%(ext)s")
+        info_opts = {
             "quiet": True,
             "nocheckcertificate": True,
             "skip_download": True,
         }
+        return {
+            "info": info_opts,
+            "comments": {
+                **info_opts,
+                "getcomments": True,
+                "extractor_args": {
+                    "youtube": {"comment_sort": ["top"], "max_comments": [str(COMMENT_LIMIT)]}
+                },
+            },
+            "video": {
+                "format": "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best",
+                "outtmpl": output_template,
+                "quiet": True,
+                "no_warnings": True,
+                "nocheckcertificate": True,
+                "progress_hooks": [self._progress_hook],
+            },
+            "audio": {
+                "format": "bestaudio[ext=m4a]/bestaudio/best",
+                "outtmpl": output_template,
+                "quiet": True,
+                "no_warnings": True,
+                "nocheckcertificate": True,
+                "progress_hooks": [self._progress_hook],
+            },
+            "subtitles": {
+                "skip_download": True,
+                "subtitlesformat": "srt",
+                "outtmpl": output_template,
+                "quiet": True,
+                "nocheckcertificate": True,
+                "progress_hooks": [self._progress_hook],
+            },
+        }
+
+    @contextmanager
+    def _downloader(self, profile: str, **overrides):
+        lock = self._ydl_locks[profile]
+        if not lock.acquire(blocking=False):
+            with yt_dlp.YoutubeDL({**self._ydl_profiles[profile], **overrides}) as ydl:
+                yield ydl
+            return
+        try:
+            ydl = self._ydl_instances.get(profile)
+            if ydl is None:
+                ydl = yt_dlp.YoutubeDL(self._ydl_profiles[profile])
+                self._ydl_instances[profile] = ydl
+            ydl.params.update(overrides)
+            yield ydl
+        finally:
+            lock.release()
+
+    def _close_downloaders(self) -> None:
+        for ydl in self._ydl_instances.values():
+            ydl.close()
+
+    @requires_url
+    def _fetch_info(self, url: str) -> None:
+        self._set_status_main("Analyzing the link...")
+        self._run_detached(self._fetch_info_worker, url, self._thumbnail_target_size())
+
+    def _run_detached(self, worker, *args) -> None:
+        threading.Thread(target=worker, args=args, daemon=True).start()
+
+    def _fetch_info_worker(self, url: str, thumbnail_size: tuple[int, int]) -> None:
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            with self._downloader("info") as ydl:
                 info = ydl.extract_info(url, download=False)
-            self.current_info = VideoInfo(
+            video_info = VideoInfo(
                 url=url,
                 title=info.get("title", ""),
                 uploader=info.get("uploader", ""),
@@ -465,19 +684,34 @@ class EagleV75App:
                 description=info.get("description", "") or "",
                 tags=info.get("tags") or [],
             )
-            self.current_title = self.current_info.title
-            details = self._format_info(self.current_info)
-            self.root.after(0, lambda: self._append_info(details))
-            self.root.after(0, lambda: self._append_description(self._format_description(self.current_info)))
-            self.root.after(0, self._update_subtitle_meta)
-            self.root.after(0, lambda: self._apply_language_options(info))
-            self._fetch_thumbnail(info.get("thumbnail"))
-            self._set_status("Link analyzed successfully.")
+            self.current_info = video_info
+            self.current_title = video_info.title
+            self.root.after(
+                0,
+                self._apply_info_result,
+                self._format_info(video_info),
+                self._format_description(video_info),
+                self._build_language_options(info),
+            )
+            self._set_status_worker("Link analyzed successfully.")
         except Exception as exc:
-            self._set_status(f"Link analysis failed: {exc}")
+            self._set_status_worker(f"Link analysis failed: {exc}")
+            return
+        self._fetch_thumbnail(info.get("thumbnail"), thumbnail_size)
+
+    def _apply_info_result(
+        self,
+        details: str,
+        description: str,
+        language_options: tuple[list[str], dict[str, tuple[str, str]]],
+    ) -> None:
+        self._append_info(details)
+        self._update_subtitle_meta()
+        self._set_language_options(language_options)
+        self._append_description(description)
 
     def _format_info(self, info: VideoInfo) -> str:
-        duration = time.strftime("%H:%M:%S", time.gmtime(info.duration)) if info.duration else "Unknown"
+        duration = self._format_duration(info.duration) if info.duration else "Unknown"
         return (
             f"Title: {info.title}\n"
             f"Channel: {info.uploader}\n"
@@ -491,7 +725,7 @@ class EagleV75App:
     def _format_description(self, info: VideoInfo) -> str:
         description = info.description.strip()
         if description:
-            description = "\n".join(description.splitlines()[:8])
+            description = "\n".join(description.split("\n", 8)[:8])
         tags = ", ".join(info.tags or [])
         return (
             "Highlights from the video description:\n"
@@ -499,15 +733,23 @@ class EagleV75App:
             f"Tags: {tags if tags else 'None'}"
         )
 
-    def _fetch_thumbnail(self, url: str | None) -> None:
+    def _thumbnail_target_size(self) -> tuple[int, int]:
+        width = self.thumbnail_label.winfo_width()
+        height = self.thumbnail_label.winfo_height()
+        if width <= 1 or height <= 1:
+            return THUMB_SIZE
+        scaling = ctk.ScalingTracker.get_widget_scaling(self.thumbnail_label)
+        return (
+            min(round(width / scaling), THUMB_SIZE[0]),
+            min(round(height / scaling), THUMB_SIZE[1]),
+        )
+
+    def _fetch_thumbnail(self, url: str | None, size: tuple[int, int] = THUMB_SIZE) -> None:
         if not url:
             return
         try:
-            with urlopen(url) as response:
-                data = response.read()
-            image = Image.open(BytesIO(data)).convert("RGB")
-            image.thumbnail((420, 240))
-            self.root.after(0, lambda: self._update_thumbnail(image))
+            image = _load_thumbnail(url, size)
+            self.root.after(0, self._update_thumbnail, image)
         except Exception as exc:
             logging.info("Thumbnail fetch failed: %s", exc)
 
@@ -516,138 +758,114 @@ class EagleV75App:
         self.thumbnail_image = ctk_image
         self.thumbnail_label.configure(image=ctk_image, text="")
 
-    def _download_video(self) -> None:
-        url = self.url_var.get().strip()
-        if not url:
-            messagebox.showwarning("Heads up", "Please paste a YouTube link first.")
-            return
+    @requires_url
+    def _download_video(self, url: str) -> None:
         self._reset_progress()
-        self._set_status("Downloading video...")
-        threading.Thread(target=self._download_video_worker, args=(url,), daemon=True).start()
+        self._set_status_main("Downloading video...")
+        self._pool.submit(self._download_video_worker, url)
 
-    def _download_audio(self) -> None:
-        url = self.url_var.get().strip()
-        if not url:
-            messagebox.showwarning("Heads up", "Please paste a YouTube link first.")
-            return
+    @requires_url
+    def _download_audio(self, url: str) -> None:
         self._reset_progress()
-        self._set_status("Downloading audio...")
-        threading.Thread(target=self._download_audio_worker, args=(url,), daemon=True).start()
+        self._set_status_main("Downloading audio...")
+        self._pool.submit(self._download_audio_worker, url)
 
     def _download_video_worker(self, url: str) -> None:
-        ydl_opts = {
-            "format": "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best",
-            "outtmpl": os.path.join(DOWNLOAD_DIR, "%(title)s.%(ext)s"),
-            "quiet": True,
-            "no_warnings": True,
-            "nocheckcertificate": True,
-            "progress_hooks": [self._progress_hook],
-        }
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            with self._downloader("video") as ydl:
                 ydl.download([url])
-            self._set_status("Video downloaded successfully.")
+            self._set_status_worker("Video downloaded successfully.")
             self.root.after(0, self._refresh_video_list)
         except Exception as exc:
-            self._set_status(f"Video download failed: {exc}")
+            self._set_status_worker(f"Video download failed: {exc}")
 
     def _download_audio_worker(self, url: str) -> None:
-        ydl_opts = {
-            "format": "bestaudio[ext=m4a]/bestaudio/best",
-            "outtmpl": os.path.join(DOWNLOAD_DIR, "%(title)s.%(ext)s"),
-            "quiet": True,
-            "no_warnings": True,
-            "nocheckcertificate": True,
-            "progress_hooks": [self._progress_hook],
-        }
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            with self._downloader("audio") as ydl:
                 ydl.download([url])
-            self._set_status("Audio downloaded successfully.")
+            self._set_status_worker("Audio downloaded successfully.")
             self.root.after(0, self._refresh_video_list)
         except Exception as exc:
-            self._set_status(f"Audio download failed: {exc}")
+            self._set_status_worker(f"Audio download failed: {exc}")
 
     def _refresh_video_list(self) -> None:
-        if not os.path.exists(DOWNLOAD_DIR):
+        try:
+            mtime = os.stat(DOWNLOAD_DIR).st_mtime_ns
+        except FileNotFoundError:
+            return
+        if mtime == self._library_mtime:
+            return
+        with os.scandir(DOWNLOAD_DIR) as entries:
+            files = sorted(
+                entry.name
+                for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in VIDEO_EXTENSION_SET and not entry.is_dir()
+            )
+        first_scan = self._library_mtime == -1
+        self._library_mtime = mtime
+        if files == self._library_files and not first_scan:
             return
-        files = sorted(f for f in os.listdir(DOWNLOAD_DIR) if f.lower().endswith(VIDEO_EXTENSIONS))
+        self._library_files = files
         self._render_video_list(files)
 
     def _select_video(self, filename: str) -> None:
         base_path = os.path.join(DOWNLOAD_DIR, os.path.splitext(filename)[0])
         srt_path = f"{base_path}.srt"
         if os.path.exists(srt_path):
-            with open(srt_path, "r", encoding="utf-8") as handle:
-                self._append_subtitles(handle.read())
-            self._set_status("Loaded subtitles from local file.")
+            self._append_subtitles(_read_text(srt_path))
+            self._set_status_main("Loaded subtitles from local file.")
         else:
-            self._set_status("No saved subtitles for this video yet.")
+            self._set_status_main("No saved subtitles for this video yet.")
 
-    def _refresh_languages(self) -> None:
-        url = self.url_var.get().strip()
-        if not url:
-            messagebox.showwarning("Heads up", "Please paste a YouTube link first.")
-            return
-        self._set_status("Fetching available languages...")
-        threading.Thread(target=self._refresh_languages_worker, args=(url,), daemon=True).start()
+    @requires_url
+    def _refresh_languages(self, url: str) -> None:
+        self._set_status_main("Fetching available languages...")
+        self._run_detached(self._refresh_languages_worker, url)
 
     def _refresh_languages_worker(self, url: str) -> None:
-        ydl_opts = {
-            "quiet": True,
-            "nocheckcertificate": True,
-            "skip_download": True,
-        }
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            with self._downloader("info") as ydl:
                 info = ydl.extract_info(url, download=False)
-            self.root.after(0, lambda: self._apply_language_options(info))
-            self._set_status("Languages refreshed.")
+            self.root.after(0, self._apply_language_options, info)
+            self._set_status_worker("Languages refreshed.")
         except Exception as exc:
-            self._set_status(f"Language refresh failed: {exc}")
+            self._set_status_worker(f"Language refresh failed: {exc}")
 
-    def _fetch_comments(self) -> None:
-        url = self.url_var.get().strip()
-        if not url:
-            messagebox.showwarning("Heads up", "Please paste a YouTube link first.")
-            return
-        self._set_status("Fetching top comments...")
-        threading.Thread(target=self._fetch_comments_worker, args=(url,), daemon=True).start()
+    @requires_url
+    def _fetch_comments(self, url: str) -> None:
+        self._set_status_main("Fetching top comments...")
+        self._run_detached(self._fetch_comments_worker, url)
 
     def _fetch_comments_worker(self, url: str) -> None:
-        ydl_opts = {
-            "quiet": True,
-            "nocheckcertificate": True,
-            "skip_download": True,
-            "getcomments": True,
-            "comment_sort": "top",
-        }
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            with self._downloader("comments") as ydl:
                 info = ydl.extract_info(url, download=False)
             comments = info.get("comments") or []
             if not comments:
-                self.root.after(0, lambda: self._append_comments("No comments available."))
-                self._set_status("No comments found.")
+                self.root.after(0, self._append_comments, "No comments available.")
+                self._set_status_worker("No comments found.")
                 return
             formatted = []
-            for idx, comment in enumerate(comments[:10], start=1):
+            for idx, comment in enumerate(comments[:COMMENT_LIMIT], start=1):
                 author = comment.get("author") or "Unknown"
                 text = comment.get("text") or ""
                 like_count = comment.get("like_count") or 0
                 formatted.append(f"{idx}. {author} ({like_count} likes)\n{text}")
-            self.root.after(0, lambda: self._append_comments("\n\n".join(formatted)))
-            self._set_status("Top comments loaded.")
+            self.root.after(0, self._append_comments, "\n\n".join(formatted))
+            self._set_status_worker("Top comments loaded.")
         except Exception as exc:
-            self._set_status(f"Comment fetch failed: {exc}")
+            self._set_status_worker(f"Comment fetch failed: {exc}")
 
     def _extract_links(self) -> None:
         content = self.comments_text.get("1.0", "end")
-        links = re.findall(r"https?://\\S+", content)
+        links = list(dict.fromkeys(URL_PATTERN.findall(content)))
         self._render_links(links)
 
     def _apply_language_options(self, info: dict) -> None:
-        options, mapping = self._build_language_options(info)
+        self._set_language_options(self._build_language_options(info))
+
+    def _set_language_options(self, built: tuple[list[str], dict[str, tuple[str, str]]]) -> None:
+        options, mapping = built
         self.lang_display_map = mapping
         self.lang_combo.configure(values=options)
         if options:
@@ -656,45 +874,24 @@ class EagleV75App:
     def _build_language_options(self, info: dict) -> tuple[list[str], dict[str, tuple[str, str]]]:
         manual = info.get("subtitles") or {}
         auto = info.get("automatic_captions") or {}
-        options: list[str] = []
-        mapping: dict[str, tuple[str, str]] = {}
-
-        def add(lang: str, kind: str) -> None:
-            label = f"{lang} ({kind})"
-            if label not in mapping:
-                options.append(label)
-                mapping[label] = (lang, kind)
-
-        for lang in manual.keys():
-            add(lang, "Manual")
-        for lang in auto.keys():
-            add(lang, "Auto")
-        for lang in DEFAULT_LANG_PRIORITY:
-            add(lang, "Default")
-
-        ordered = self._order_language_labels(options, mapping)
-        return ordered, mapping
-
-    def _order_language_labels(
-        self, options: list[str], mapping: dict[str, tuple[str, str]]
-    ) -> list[str]:
-        kind_priority = {"Manual": 0, "Auto": 1, "Default": 2}
-
-        def key(label: str) -> tuple[int, str, int]:
-            lang, kind = mapping[label]
-            priority = 0 if lang in PREFERRED_LANGS else 1
-            return (priority, lang, kind_priority.get(kind, 3))
-
-        return sorted(options, key=key)
-
-    def _download_subtitles(self) -> None:
-        url = self.url_var.get().strip()
-        if not url:
-            messagebox.showwarning("Heads up", "Please paste a YouTube link first.")
-            return
+        seen = dict.fromkeys(
+            itertools.chain(
+                ((lang, "Manual") for lang in manual),
+                ((lang, "Auto") for lang in auto),
+                ((lang, "Default") for lang in DEFAULT_LANG_PRIORITY),
+            )
+        )
+        ordered = sorted(
+            seen, key=lambda pair: (pair[0] not in PREFERRED_LANG_SET, pair[0], KIND_PRIORITY[pair[1]])
+        )
+        options = [f"{lang} ({kind})" for lang, kind in ordered]
+        return options, dict(zip(options, ordered))
+
+    @requires_url
+    def _download_subtitles(self, url: str) -> None:
         self._reset_progress()
-        self._set_status("Fetching subtitles from YouTube...")
-        threading.Thread(target=self._download_subtitles_worker, args=(url,), daemon=True).start()
+        self._set_status_main("Fetching subtitles from YouTube...")
+        self._pool.submit(self._download_subtitles_worker, url)
 
     def _download_subtitles_worker(self, url: str) -> None:
         selection = self.lang_combo.get().strip()
@@ -703,35 +900,25 @@ class EagleV75App:
         )
         manual_only = kind == "Manual"
         auto_only = kind == "Auto"
-        output_template = os.path.join(DOWNLOAD_DIR, "%(title)s.%(ext)s")
-        ydl_opts = {
-            "skip_download": True,
-            "writesubtitles": manual_only or kind == "Default",
-            "writeautomaticsub": auto_only or kind == "Default",
-            "subtitleslangs": [lang],
-            "subtitlesformat": "srt",
-            "outtmpl": output_template,
-            "quiet": True,
-            "nocheckcertificate": True,
-            "progress_hooks": [self._progress_hook],
-        }
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                ydl.download([url])
-            base_path = os.path.splitext(ydl.prepare_filename(info))[0]
+            with self._downloader(
+                "subtitles",
+                writesubtitles=manual_only or kind == "Default",
+                writeautomaticsub=auto_only or kind == "Default",
+                subtitleslangs=[lang],
+            ) as ydl:
+                info = ydl.extract_info(url, download=True)
+                base_path = os.path.splitext(ydl.prepare_filename(info))[0]
             srt_path = self._resolve_srt_path(base_path, lang)
             if not srt_path:
-                self._set_status("No subtitle file found after download.")
+                self._set_status_worker("No subtitle file found after download.")
                 return
-            with open(srt_path, "r", encoding="utf-8") as handle:
-                subtitle_content = handle.read()
-            self.root.after(0, lambda: self._append_subtitles(subtitle_content))
+            self.root.after(0, self._append_subtitles, _read_text(srt_path))
             self.root.after(0, self._copy_subtitles)
-            self._set_status("Subtitles fetched and copied.")
+            self._set_status_worker("Subtitles fetched and copied.")
             self.root.after(0, self._refresh_video_list)
         except Exception as exc:
-            self._set_status(f"Subtitle download failed: {exc}")
+            self._set_status_worker(f"Subtitle download failed: {exc}")
 
     def _resolve_srt_path(self, base_path: str, lang: str) -> str | None:
         patterns = [
@@ -744,7 +931,7 @@ class EagleV75App:
         return None
 
     def _save_srt_as(self) -> None:
-        content = self.subtitle_text.get("1.0", "end").strip()
+        content = self._subtitle_content()
         if not content:
             messagebox.showwarning("Heads up", "No subtitles to save yet.")
             return
@@ -756,81 +943,110 @@ class EagleV75App:
         )
         if not file_path:
             return
-        with open(file_path, "w", encoding="utf-8") as handle:
-            handle.write(content)
-        self._set_status("Subtitle file saved.")
+        self._pool.submit(self._save_srt_worker, file_path, content)
 
-    def _open_in_browser(self) -> None:
-        url = self.url_var.get().strip()
-        if not url:
-            messagebox.showwarning("Heads up", "Please paste a YouTube link first.")
-            return
-        webbrowser.open(url)
-        self._set_status("Opened link in your browser.")
+    def _save_srt_worker(self, file_path: str, content: str) -> None:
+        try:
+            with open(file_path, "wb") as handle:
+                handle.write(content.encode("utf-8"))
+            self._set_status_worker("Subtitle file saved.")
+        except Exception as exc:
+            self._set_status_worker(f"Subtitle save failed: {exc}")
+
+    @requires_url
+    def _open_in_browser(self, url: str) -> None:
+        self._open_url(url)
+        self._set_status_main("Opened link in your browser.")
+
+    def _open_url(self, url: str) -> None:
+        self._pool.submit(webbrowser.open, url)
 
     def _open_download_dir(self) -> None:
-        path = os.path.abspath(DOWNLOAD_DIR)
+        path = DOWNLOAD_DIR_ABS
         if os.name == "nt":
             os.startfile(path)
         elif os.name == "posix":
-            os.system(f"xdg-open '{path}'")
-        self._set_status("Download folder opened.")
+            try:
+                subprocess.Popen(
+                    ["xdg-open", path],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                )
+            except OSError as exc:
+                self._set_status_main(f"Could not open download folder: {exc}")
+                return
+        self._set_status_main("Download folder opened.")
 
     def _copy_subtitles(self) -> None:
-        content = self.subtitle_text.get("1.0", "end").strip()
+        content = self._subtitle_content()
         if not content:
             messagebox.showwarning("Heads up", "No subtitles to copy yet.")
             return
-        self.root.clipboard_clear()
-        self.root.clipboard_append(content)
-        self._set_status("Subtitles copied to clipboard.")
+        self.root.tk.call("clipboard", "clear")
+        self.root.tk.call("clipboard", "append", "--", content)
+        self._set_status_main("Subtitles copied to clipboard.")
 
     def _reset_progress(self) -> None:
         self.progress_bar.set(0)
-        self.speed_var.set("Speed: —")
-        self.eta_var.set("ETA: —")
-        self.size_var.set("Size: —")
+        self.telemetry_var.set(TELEMETRY_IDLE)
 
     def _progress_hook(self, status: dict) -> None:
+        if self._closing:
+            raise yt_dlp.utils.DownloadCancelled("Application is closing.")
         if status.get("status") != "downloading":
             if status.get("status") == "finished":
-                self.progress_bar.set(1)
+                self._queue_progress(1.0, None)
             return
         downloaded = status.get("downloaded_bytes") or 0
         total = status.get("total_bytes") or status.get("total_bytes_estimate") or 0
         speed = status.get("speed") or 0
         eta = status.get("eta") or 0
         progress = (downloaded / total) if total else 0
-        size_text = f"Size: {self._format_bytes(total) if total else '—'}"
-        speed_text = f"Speed: {self._format_bytes(speed)}/s" if speed else "Speed: —"
-        eta_text = f"ETA: {int(eta)}s" if eta else "ETA: —"
-
-        def update() -> None:
-            self.progress_bar.set(progress)
-            self.size_var.set(size_text)
-            self.speed_var.set(speed_text)
-            self.eta_var.set(eta_text)
+        self._queue_progress(progress, (total, speed, eta))
+
+    def _queue_progress(self, progress: float, stats: tuple[float, float, float] | None) -> None:
+        with self._progress_lock:
+            if stats is None and self._pending_progress is not None:
+                stats = self._pending_progress[1]
+            self._pending_progress = (progress, stats)
+            if self._repaint_scheduled:
+                return
+            self._repaint_scheduled = True
+        self.root.after(PROGRESS_FLUSH_MS, self._flush_progress)
+
+    def _flush_progress(self) -> None:
+        with self._progress_lock:
+            pending = self._pending_progress
+            self._pending_progress = None
+            self._repaint_scheduled = False
+        if pending is not None:
+            self._apply_progress(*pending)
+
+    def _apply_progress(self, progress: float, stats: tuple[float, float, float] | None) -> None:
+        self.progress_bar.set(progress)
+        if stats is not None:
+            self.telemetry_var.set(self._format_telemetry(*stats))
+
+    def _format_telemetry(self, total: float, speed: float, eta: float) -> str:
+        return TELEMETRY_TEMPLATE % (
+            "%s/s" % self._format_bytes(speed) if speed else "—",
+            "%ds" % eta if eta else "—",
+            self._format_bytes(total) if total else "—",
+        )
 
-        self.root.after(0, update)
+    @staticmethod
+    def _format_duration(seconds: int) -> str:
+        hours, remainder = divmod(int(seconds), 3600)
+        minutes, seconds = divmod(remainder, 60)
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
     @staticmethod
     def _format_bytes(amount: float) -> str:
         if amount <= 0:
             return "0 B"
-        units = ["B", "KB", "MB", "GB", "TB"]
-        index = 0
-        while amount >= 1024 and index < len(units) - 1:
-            amount /= 1024
-            index += 1
-        return f"{amount:.1f} {units[index]}"
-
-    def _poll_queue(self) -> None:
-        try:
-            while True:
-                self.queue.get_nowait()
-        except Empty:
-            pass
-        self.root.after(250, self._poll_queue)
+        index = min(max(int(amount).bit_length() - 1, 0) // 10, len(BYTE_UNITS) - 1)
+        return f"{amount * BYTE_SCALES[index]:.1f} {BYTE_UNITS[index]}"
 
 
 def main() -> None: